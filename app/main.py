@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import FileResponse
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 from .models import PlannerRequest
-from .planner import AIPlanner
+from .planner import AIPlanner, aclose_clients
 from .registry import SkillRegistry
 
 
@@ -14,7 +15,15 @@ ROOT = Path(__file__).resolve().parents[1]
 WEB_DIR = ROOT / "web"
 SKILLS_DIR = ROOT / "skills"
 
-app = FastAPI(title="Zeon Planner UI")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Release pooled provider connections on shutdown
+    await aclose_clients()
+
+
+app = FastAPI(title="Zeon Planner UI", default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # Static files for the web UI
 app.mount("/static", StaticFiles(directory=str(WEB_DIR)), name="static")
@@ -26,29 +35,26 @@ registry.load()
 planner = AIPlanner(registry)
 
 
-@app.get("/")
-async def index():
-    index_path = WEB_DIR / "index.html"
-    if not index_path.exists():
-        raise HTTPException(status_code=500, detail="UI not found")
-    return FileResponse(str(index_path))
-
-
 @app.get("/api/skills")
 async def list_skills():
-    return [s.model_dump() for s in registry.list()]
+    return Response(content=registry.summaries_bytes(), media_type="application/json")
 
 
 @app.get("/api/skills/{name}")
 async def get_skill(name: str):
-    spec = registry.get(name)
-    if not spec:
+    content = registry.get_dump_bytes(name)
+    if content is None:
         raise HTTPException(status_code=404, detail="Skill not found")
-    return spec.model_dump()
+    return Response(content=content, media_type="application/json")
 
 
 @app.post("/api/plan")
 async def create_plan(req: PlannerRequest):
-    result = planner.plan(req)
-    return result.model_dump()
+    result = await planner.plan(req)
+    # Serialize straight to JSON in pydantic-core rather than via a dict
+    return Response(content=result.model_dump_json(), media_type="application/json")
+
 
+# Serve the UI shell last so it never shadows the API routes above. StaticFiles
+# handles index.html for "/" with ETag/Last-Modified/304 and picks up edits.
+app.mount("/", StaticFiles(directory=str(WEB_DIR), html=True), name="ui")
@@ -1,17 +1,23 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import os
-from typing import Dict, List, Any
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List
+
+import orjson
 
 from .models import PlanResult, PlanStep, PlannerRequest
 from .registry import SkillRegistry
-from jsonschema import Draft202012Validator, ValidationError
+from jsonschema import ValidationError
 
 try:
-    from openai import OpenAI
+    import httpx
+    from openai import AsyncOpenAI, DefaultAsyncHttpxClient
     from openai import BadRequestError as OpenAIBadRequestError
 except Exception:  # pragma: no cover
-    OpenAI = None  # type: ignore
+    AsyncOpenAI = None  # type: ignore
     OpenAIBadRequestError = Exception  # type: ignore
 
 try:
@@ -25,32 +31,122 @@ try:
 except Exception:  # pragma: no cover
     BAML_AVAILABLE = False
 
+
+# Provider clients are reused across requests so each plan doesn't pay for a
+# fresh TCP/TLS handshake; OpenAI clients share one pool. The caches are small
+# LRUs keyed by a digest of the API key, so caller-supplied keys can't pile up.
+_MAX_CACHED_CLIENTS = 8
+_http_client: httpx.AsyncClient | None = None
+_openai_clients: OrderedDict[str, Any] = OrderedDict()
+_gemini_clients: OrderedDict[str, Any] = OrderedDict()
+
+
+def _cached_client(cache: OrderedDict[str, Any], api_key: str, factory: Callable[[], Any]) -> Any:
+    key = hashlib.sha256(api_key.encode()).hexdigest()
+    client = cache.get(key)
+    if client is not None:
+        cache.move_to_end(key)
+        return client
+    client = factory()
+    cache[key] = client
+    if len(cache) > _MAX_CACHED_CLIENTS:
+        # An evicted client may still be serving a request; let GC reclaim it
+        cache.popitem(last=False)
+    return client
+
+
+def _get_openai_client(api_key: str) -> Any:
+    global _http_client
+    if _http_client is None:
+        _http_client = DefaultAsyncHttpxClient(
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+        )
+    http_client = _http_client
+    return _cached_client(_openai_clients, api_key, lambda: AsyncOpenAI(api_key=api_key, http_client=http_client))
+
+
+def _get_gemini_client(api_key: str) -> Any:
+    return _cached_client(_gemini_clients, api_key, lambda: genai_pkg.Client(api_key=api_key))
+
+
+async def aclose_clients() -> None:
+    """Close cached provider clients and the shared HTTP pool (call on shutdown)."""
+    global _http_client
+    gemini_clients = list(_gemini_clients.values())
+    _gemini_clients.clear()
+    # OpenAI clients only hold the shared pool, which is closed once below
+    _openai_clients.clear()
+    try:
+        for client in gemini_clients:
+            # Client.close/AsyncClient.aclose only exist in google-genai >= 1.40
+            try:
+                aclose = getattr(client.aio, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+                close = getattr(client, "close", None)
+                if close is not None:
+                    close()
+            except Exception:
+                # Best effort on shutdown; one bad client must not skip the rest
+                continue
+    finally:
+        if _http_client is not None:
+            http_client, _http_client = _http_client, None
+            await http_client.aclose()
+
+
+_PLANNING_FIELDS = {
+    "name",
+    "version",
+    "tier",
+    "description",
+    "input_schema",
+    "output_schema",
+    "preconditions",
+    "postconditions",
+    "invariants",
+}
+
+_INSTRUCTIONS = (
+    "You are a robotics task planner. Given a user task and a library of atomic skills, "
+    "produce a minimal, deterministic sequence of steps. Each step must reference an existing skill name and "
+    "provide an 'inputs' object that validates against that skill's input_schema."
+    "\nConstraints:\n- Only use skills provided.\n- No free-form actions.\n- Be conservative and explicit.\n- Return strictly JSON matching this schema: {\"steps\":[{\"skill\":string,\"inputs\":object,\"rationale\":string}]}\n"
+)
+
+
 class AIPlanner:
     """Provider-agnostic AI planner with schema validation and registry awareness."""
 
-    def __init__(self, registry: SkillRegistry) -> None:
+    def __init__(self, registry: SkillRegistry, max_concurrency: int = 5) -> None:
         self.registry = registry
+        # Bound concurrent provider calls and coalesce identical in-flight requests
+        self._provider_slots = asyncio.Semaphore(max_concurrency)
+        self._inflight: Dict[str, asyncio.Future[PlanResult]] = {}
+        # Serialized once per registry load rather than per request
+        self._skills_generation = -1
+        self._serialized_skills: List[Dict[str, Any]] = []
+        self._prompt_prefix = ""
+        self._refresh_skills()
+
+    def _refresh_skills(self) -> None:
+        if self._skills_generation == self.registry.generation:
+            return
+        self._serialized_skills = self._serialize_registry()
+        serialized_json = orjson.dumps(self._serialized_skills).decode()
+        self._prompt_prefix = _INSTRUCTIONS + "\nSkills:\n" + serialized_json + "\n"
+        self._skills_generation = self.registry.generation
 
     def _serialize_registry(self) -> List[Dict[str, Any]]:
-        # Provide only planning-relevant fields to the LLM
+        # Provide only planning-relevant fields to the LLM; nulls only cost tokens
         return [
-            {
-                "name": s.name,
-                "version": s.version,
-                "tier": s.tier,
-                "description": s.description,
-                "input_schema": s.input_schema,
-                "output_schema": s.output_schema,
-                "preconditions": s.preconditions,
-                "postconditions": s.postconditions,
-                "invariants": s.invariants,
-            }
+            s.model_dump(mode="json", include=_PLANNING_FIELDS, exclude_none=True)
             for s in self.registry.all_specs()
         ]
 
     def _validate_steps(self, steps: List[Dict[str, Any]]) -> List[PlanStep]:
         validated: List[PlanStep] = []
-        name_to_spec = {s.name: s for s in self.registry.all_specs()}
+        name_to_spec = self.registry.by_name()
 
         for idx, step in enumerate(steps, start=1):
             skill = step.get("skill")
@@ -59,78 +155,82 @@ class AIPlanner:
             spec = name_to_spec.get(skill)
             if not spec:
                 raise ValueError(f"Unknown skill in plan: {skill}")
-            schema = spec.input_schema or {"type": "object"}
-            Draft202012Validator.check_schema(schema)
-            Draft202012Validator(schema).validate(inputs)
-            validated.append(PlanStep(order=idx, skill=skill, inputs=inputs, rationale=rationale))
+            self.registry.get_validator(skill).validate(inputs)
+            # The skill schema only enforces an object if it declares "type": "object"
+            if not isinstance(inputs, dict):
+                raise ValueError(f"Invalid inputs for step {idx}: expected an object")
+            if rationale is not None and not isinstance(rationale, str):
+                raise ValueError(f"Invalid rationale for step {idx}: expected a string")
+            # Every field is checked above; skip Pydantic re-validation
+            validated.append(PlanStep.model_construct(order=idx, skill=skill, inputs=inputs, rationale=rationale))
 
         return validated
 
     def _prompt(self, req: PlannerRequest) -> str:
-        return (
-            "You are a robotics task planner. Given a user task and a library of atomic skills, "
-            "produce a minimal, deterministic sequence of steps. Each step must reference an existing skill name and "
-            "provide an 'inputs' object that validates against that skill's input_schema."
-            "\nConstraints:\n- Only use skills provided.\n- No free-form actions.\n- Be conservative and explicit.\n- Return strictly JSON matching this schema: {\"steps\":[{\"skill\":string,\"inputs\":object,\"rationale\":string}]}\n"
-            f"\nUser task: {req.task}\n"
-        )
+        return self._prompt_prefix + f"\nUser task: {req.task}\n"
 
-    def _call_openai(self, req: PlannerRequest) -> Dict[str, Any]:
-        if OpenAI is None:
+    async def _call_openai(self, req: PlannerRequest) -> Dict[str, Any]:
+        if AsyncOpenAI is None:
             raise RuntimeError("openai package not installed")
         api_key = req.api_key or os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise RuntimeError("OPENAI_API_KEY missing")
-        client = OpenAI(api_key=api_key)
+        client = _get_openai_client(api_key)
         model = req.model or "gpt-4o-mini"
 
         system = "You return only valid JSON. No markdown, no prose."
-        user = self._prompt(req) + "\nSkills:\n" + str(self._serialize_registry())
+        user = self._prompt(req)
 
-        # Prefer deterministic sampling; if model disallows temperature, retry without it
-        try:
-            resp = client.chat.completions.create(
-                model=model,
-                messages=[
-                    {"role": "system", "content": system},
-                    {"role": "user", "content": user},
-                ],
-                temperature=0,
-            )
-        except OpenAIBadRequestError as e:
-            msg = str(e).lower()
-            if "temperature" in msg and "unsupported" in msg:
-                resp = client.chat.completions.create(
-                    model=model,
-                    messages=[
-                        {"role": "system", "content": system},
-                        {"role": "user", "content": user},
-                    ],
-                )
-            else:
-                raise
+        messages = [
+            {"role": "system", "content": system},
+            {"role": "user", "content": user},
+        ]
+        # Prefer deterministic sampling in JSON mode; if the model rejects either
+        # option, drop the ones it names and retry (each is dropped at most once)
+        options: Dict[str, Any] = {"temperature": 0, "response_format": {"type": "json_object"}}
+        while True:
+            try:
+                resp = await client.chat.completions.create(model=model, messages=messages, **options)
+                break
+            except OpenAIBadRequestError as e:
+                msg = str(e).lower()
+                rejected = [
+                    name for name in options if name in msg and ("unsupported" in msg or "not supported" in msg)
+                ]
+                if not rejected:
+                    raise
+                for name in rejected:
+                    del options[name]
         content = resp.choices[0].message.content or "{}"
-        import json
-
-        return json.loads(content)
+        return orjson.loads(content)
 
-    def _call_gemini(self, req: PlannerRequest) -> Dict[str, Any]:
+    async def _call_gemini(self, req: PlannerRequest) -> Dict[str, Any]:
         if genai_pkg is None:
             raise RuntimeError("google-genai package not installed")
         api_key = req.api_key or os.getenv("GEMINI_API_KEY")
         if not api_key:
             raise RuntimeError("GEMINI_API_KEY missing")
         model_name = req.model or "gemini-1.5-pro"
-        client = genai_pkg.Client(api_key=api_key)
+        client = _get_gemini_client(api_key)
 
-        prompt = "Return only JSON, no markdown.\n" + self._prompt(req) + "\nSkills:\n" + str(self._serialize_registry())
-        result = client.models.generate_content(model=model_name, contents=prompt)
+        prompt = "Return only JSON, no markdown.\n" + self._prompt(req)
+        result = await client.aio.models.generate_content(model=model_name, contents=prompt)
         text = result.text or "{}"
-        import json
+        return orjson.loads(text)
 
-        return json.loads(text)
+    async def plan(self, req: PlannerRequest) -> PlanResult:
+        key = req.model_dump_json()
+        pending = self._inflight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._plan(req))
+            self._inflight[key] = pending
+            pending.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one caller disconnecting doesn't cancel the others' plan
+        return await asyncio.shield(pending)
 
-    def plan(self, req: PlannerRequest) -> PlanResult:
+    async def _plan(self, req: PlannerRequest) -> PlanResult:
+        # Pick up a reloaded registry so prompts match what steps are validated against
+        self._refresh_skills()
         provider = (req.provider or "openai").lower()
         try:
             # Optional BAML integration when requested and available
@@ -139,24 +239,29 @@ class AIPlanner:
                 # For now call a generic function if present, else fall through
                 try:
                     # Example BAML function name: PlanWithSkills
-                    raw = baml_b.PlanWithSkills(
-                        {
-                            "task": req.task,
-                            "skills": self._serialize_registry(),
-                            "provider": provider,
-                            "model": req.model or "",
-                        }
-                    )
+                    # The generated BAML client is sync; keep it off the event loop
+                    async with self._provider_slots:
+                        raw = await asyncio.to_thread(
+                            baml_b.PlanWithSkills,
+                            {
+                                "task": req.task,
+                                "skills": self._serialized_skills,
+                                "provider": provider,
+                                "model": req.model or "",
+                            }
+                        )
                 except Exception:
                     raw = None
                 if isinstance(raw, dict) and isinstance(raw.get("steps"), list):
                     steps = self._validate_steps(raw["steps"])
-                    return PlanResult(task=req.task, steps=steps, notes=f"Provider: baml->{provider}")
+                    return PlanResult.model_construct(task=req.task, steps=steps, notes=f"Provider: baml->{provider}")
 
             if provider == "openai":
-                raw = self._call_openai(req)
+                async with self._provider_slots:
+                    raw = await self._call_openai(req)
             elif provider == "gemini":
-                raw = self._call_gemini(req)
+                async with self._provider_slots:
+                    raw = await self._call_gemini(req)
             else:
                 raise RuntimeError(f"Unsupported provider: {provider}")
 
@@ -165,7 +270,8 @@ class AIPlanner:
                 raise ValueError("Planner output missing 'steps' list")
 
             steps = self._validate_steps(steps_dicts)
-            return PlanResult(task=req.task, steps=steps, notes=f"Provider: {provider}")
+            # Steps are already validated; skip re-validating the envelope
+            return PlanResult.model_construct(task=req.task, steps=steps, notes=f"Provider: {provider}")
         except ValidationError as ve:
             raise RuntimeError(f"Input validation failed: {ve.message}")
         except Exception as e:
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
-import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+import orjson
+from jsonschema import Draft202012Validator
 
 from .models import SkillSpec, SkillSummary
 
@@ -11,19 +16,62 @@ class SkillRegistry:
     def __init__(self, skills_dir: Path) -> None:
         self.skills_dir = skills_dir
         self._skills: Dict[str, SkillSpec] = {}
+        self._skills_view: Mapping[str, SkillSpec] = MappingProxyType(self._skills)
+        self._validators: Dict[str, Draft202012Validator] = {}
+        self._summaries_bytes: bytes = b"[]"
+        self._spec_dumps: Dict[str, bytes] = {}
+        # Bumped on every load() so consumers can tell when derived data is stale
+        self.generation = 0
 
     def load(self) -> None:
+        self.generation += 1
         self._skills.clear()
-        if not self.skills_dir.exists():
+        self._validators.clear()
+        self._summaries_bytes = b"[]"
+        self._spec_dumps = {}
+        # One scandir pass instead of exists() + glob. is_file() answers from the
+        # dirent type for regular entries; symlinks are followed (one stat each)
+        # on purpose, so symlinked skill files still load as they did with glob.
+        try:
+            with os.scandir(self.skills_dir) as entries:
+                paths = sorted(
+                    Path(e.path)
+                    for e in entries
+                    if e.name.endswith(".json") and not e.name.startswith(".") and e.is_file()
+                )
+        except OSError:
+            # Missing, not a directory, or unreadable: glob tolerated all of
+            # these with an empty registry, so keep doing that
             return
-        for path in sorted(self.skills_dir.glob("*.json")):
-            try:
-                data = json.loads(path.read_text())
-                spec = SkillSpec(**data)
-                self._skills[spec.name] = spec
-            except Exception as e:
-                # Skip malformed skill files; in production, log this
+        # File reads release the GIL and pydantic-core validates in Rust, so
+        # threads overlap well; map() keeps results in sorted path order
+        with ThreadPoolExecutor(max_workers=min(8, len(paths) or 1)) as pool:
+            loaded = list(pool.map(self._load_one, paths))
+        for item in loaded:
+            if item is None:
                 continue
+            spec, validator = item
+            self._skills[spec.name] = spec
+            self._validators[spec.name] = validator
+        # Specs don't change until the next load(); dump them once for the API
+        # Most optional fields are unset; leave the nulls off the wire
+        self._summaries_bytes = orjson.dumps([s.model_dump(mode="json", exclude_none=True) for s in self.list()])
+        self._spec_dumps = {
+            name: orjson.dumps(s.model_dump(mode="json", exclude_none=True)) for name, s in self._skills.items()
+        }
+
+    @staticmethod
+    def _load_one(path: Path) -> Optional[Tuple[SkillSpec, Draft202012Validator]]:
+        try:
+            spec = SkillSpec.model_validate(orjson.loads(path.read_bytes()))
+            # Check the schema once and compile its validator up front so
+            # plan validation doesn't pay for it on every step
+            schema = spec.input_schema or {"type": "object"}
+            Draft202012Validator.check_schema(schema)
+            return spec, Draft202012Validator(schema)
+        except Exception as e:
+            # Skip malformed skill files; in production, log this
+            return None
 
     def list(self) -> List[SkillSummary]:
         return [
@@ -39,6 +87,20 @@ class SkillRegistry:
     def get(self, name: str) -> Optional[SkillSpec]:
         return self._skills.get(name)
 
+    def by_name(self) -> Mapping[str, SkillSpec]:
+        # Read-only live view; no copy per call
+        return self._skills_view
+
+    def summaries_bytes(self) -> bytes:
+        return self._summaries_bytes
+
+    def get_dump_bytes(self, name: str) -> Optional[bytes]:
+        return self._spec_dumps.get(name)
+
+    def get_validator(self, name: str) -> Draft202012Validator:
+        # Every loaded spec has a validator; a miss is a bug, so let it raise
+        return self._validators[name]
+
     def all_specs(self) -> List[SkillSpec]:
         return list(self._skills.values())
 